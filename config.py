@@ -44,6 +44,10 @@ class BaseConfig:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///finvela.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {"pool_pre_ping": True}
+    # Auto-create tables at boot. Convenient for dev/SQLite; production
+    # should run Alembic migrations instead of paying create_all() metadata
+    # round-trips on every worker fork.
+    AUTO_CREATE_SCHEMA = _bool(os.getenv("AUTO_CREATE_SCHEMA"), default=True)
 
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash-lite")
@@ -65,6 +69,7 @@ class BaseConfig:
     CELERY_VISIBILITY_TIMEOUT = int(os.getenv("CELERY_VISIBILITY_TIMEOUT", "3600"))
     CELERY_TASK_DEFAULT_QUEUE = os.getenv("CELERY_TASK_DEFAULT_QUEUE", "default")
     CELERY_TASK_ALWAYS_EAGER = _bool(os.getenv("CELERY_EAGER"), default=False)
+    CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv("CELERY_WORKER_PREFETCH_MULTIPLIER", "1"))
 
     COUNTERFACT_MAX_LINES = int(os.getenv("COUNTERFACT_MAX_LINES", "200"))
     COUNTERFACT_MAX_DELTA_PCT = float(os.getenv("COUNTERFACT_MAX_DELTA_PCT", "0.5"))
@@ -299,3 +304,4 @@ class ProdConfig(BaseConfig):
     PREFERRED_URL_SCHEME = "https"
     RATELIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "60 per minute")
     CACHE_TYPE = os.getenv("CACHE_TYPE", "SimpleCache")
+    AUTO_CREATE_SCHEMA = _bool(os.getenv("AUTO_CREATE_SCHEMA"), default=False)
@@ -32,6 +32,10 @@ def make_celery(app: Flask | None = None) -> Celery:
         enable_utc=True,
         task_always_eager=app.config.get("CELERY_TASK_ALWAYS_EAGER", False),
         task_eager_propagates=True,
+        # Long-running risk jobs get their own queue so a dedicated worker
+        # (`celery worker --queues risk`) can be scaled independently.
+        task_routes={"risk.run_pipeline": {"queue": "risk"}},
+        worker_prefetch_multiplier=app.config.get("CELERY_WORKER_PREFETCH_MULTIPLIER", 1),
         broker_transport_options={
             "visibility_timeout": app.config.get("CELERY_VISIBILITY_TIMEOUT", 3600),
         },
@@ -49,7 +53,7 @@ def make_celery(app: Flask | None = None) -> Celery:
     celery.Task = AppContextTask  # type: ignore[assignment]
     celery.flask_app = app  # type: ignore[attr-defined]
 
-    celery.autodiscover_tasks(["expenseai_ingest"])
+    celery.autodiscover_tasks(["expenseai_ingest", "expenseai_risk"])
     app.extensions["celery"] = celery
     return celery
 
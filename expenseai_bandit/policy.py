@@ -26,6 +26,10 @@ def activate_policy(policy: BanditPolicy) -> None:
     policy.updated_at = datetime.utcnow()
     db.session.flush()
 
+    from expenseai_risk.weights import invalidate_weights_cache  # local import to avoid circular
+
+    invalidate_weights_cache()
+
 
 def create_policy(version: str, weights: dict[str, float], alpha: float) -> BanditPolicy:
     """Persist a new policy version with weights and alpha."""
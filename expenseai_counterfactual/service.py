@@ -96,8 +96,11 @@ def evaluate(invoice_id: int, payload: CounterfactRequest, *, actor: str) -> Cou
         grand_total=grand_after - before_totals.grand_total,
     )
 
-    contributors_before = collect_contributors(invoice.id)
-    composite_before, waterfall_before, policy_version = compute_composite(contributors_before)
+    max_contribs = int(current_app.config.get("RISK_WATERFALL_MAX_CONTRIBS", 8))
+    contributors_before = collect_contributors(invoice, max_items=max_contribs)
+    composite_before, waterfall_before, policy_version = compute_composite(
+        contributors_before, max_items=max_contribs
+    )
 
     contributors_after, hsn_mismatches = _build_counterfactual_contributors(
         invoice,
@@ -105,7 +108,9 @@ def evaluate(invoice_id: int, payload: CounterfactRequest, *, actor: str) -> Cou
         contributors_before,
         epsilon,
     )
-    composite_after, waterfall_after, policy_version_after = compute_composite(contributors_after)
+    composite_after, waterfall_after, policy_version_after = compute_composite(
+        contributors_after, max_items=max_contribs
+    )
 
     delta_composite = composite_after - composite_before
 
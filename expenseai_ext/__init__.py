@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import os
+import re
 from importlib import import_module
 from typing import Any, Dict, Type
 
 from flask import Flask
 from flask_caching import Cache
 from markupsafe import Markup, escape
+from werkzeug.utils import import_string
 
 from config import BaseConfig, DevConfig, ProdConfig
 from expenseai_ext import auth as auth_ext
@@ -48,9 +50,10 @@ def create_app(
 
     _register_template_filters(app)
 
-    from expenseai.celery_app import make_celery
-
-    make_celery(app)
+    # Import the Celery module before blueprint registration: expenseai_ingest's
+    # tasks import it, and its module-level worker self-boot would otherwise
+    # re-enter create_app while expenseai_ingest is still half-initialized.
+    import expenseai.celery_app  # noqa: F401
 
     _register_blueprints(app)
     _register_error_handlers(app)
@@ -59,13 +62,26 @@ def create_app(
     if start_background:
         _start_background_services(app)
 
-    if create_db:
-        with app.app_context():
-            db_ext.db.create_all() 
+    if create_db and app.config.get("AUTO_CREATE_SCHEMA", False):
+        _create_schema_once(app)
 
     return app
 
 
+# Memoized across create_app calls so repeated factories (e.g. test fixtures)
+# only pay the create_all() metadata round-trips once per process.
+_schema_created = False
+
+
+def _create_schema_once(app: Flask) -> None:
+    global _schema_created
+    if _schema_created:
+        return
+    with app.app_context():
+        db_ext.db.create_all()
+    _schema_created = True
+
+
 def _load_config(app: Flask, config_object: str | Type[BaseConfig] | None) -> None:
     if config_object is None:
         env_name = os.getenv("FLASK_ENV", "development").lower()
@@ -87,29 +103,27 @@ def _load_config(app: Flask, config_object: str | Type[BaseConfig] | None) -> No
     app.config.from_object(config_cls)
 
 
-def _register_blueprints(app: Flask) -> None:
-    from expenseai_auth import auth_bp
-    from expenseai_benchmark import benchmark_admin_bp
-    from expenseai_compliance import compliance_admin_bp
-    from expenseai_invoices import invoices_bp
-    from expenseai_counterfactual import counterfactual_bp
-    from expenseai_chat import chat_bp
-    from expenseai_vendor import vendor_bp
-    from expenseai_risk import risk_bp
-    from expenseai_web import web_bp
-    from expenseai_ingest import ingest_admin_bp
-
-    app.register_blueprint(web_bp)
-    app.register_blueprint(auth_bp, url_prefix="/auth")
-    app.register_blueprint(invoices_bp, url_prefix="/invoices")
+# Declarative blueprint table: each entry is imported lazily at registration
+# time so `create_app` does not eagerly pull in every feature package's
+# transitive dependencies during module import.
+BLUEPRINTS: tuple[tuple[str, str | None], ...] = (
+    ("expenseai_web:web_bp", None),
+    ("expenseai_auth:auth_bp", "/auth"),
+    ("expenseai_invoices:invoices_bp", "/invoices"),
     # Counterfactual simulator endpoints (what-if) — register after invoices to keep routes grouped
-    app.register_blueprint(counterfactual_bp)
-    app.register_blueprint(chat_bp, url_prefix="/organization")
-    app.register_blueprint(compliance_admin_bp)
-    app.register_blueprint(benchmark_admin_bp)
-    app.register_blueprint(risk_bp)
-    app.register_blueprint(vendor_bp)
-    app.register_blueprint(ingest_admin_bp)
+    ("expenseai_counterfactual:counterfactual_bp", None),
+    ("expenseai_chat:chat_bp", "/organization"),
+    ("expenseai_compliance:compliance_admin_bp", None),
+    ("expenseai_benchmark:benchmark_admin_bp", None),
+    ("expenseai_risk:risk_bp", None),
+    ("expenseai_vendor:vendor_bp", None),
+    ("expenseai_ingest:ingest_admin_bp", None),
+)
+
+
+def _register_blueprints(app: Flask) -> None:
+    for spec, url_prefix in BLUEPRINTS:
+        app.register_blueprint(import_string(spec), url_prefix=url_prefix)
 
 
 def _register_error_handlers(app: Flask) -> None:
@@ -131,23 +145,29 @@ def _register_middleware(app: Flask) -> None:
 
 def _start_background_services(app: Flask) -> None:
     """Boot background workers once the application is fully configured."""
+    from expenseai.celery_app import make_celery
     from expenseai_ai.parser_service import start_background_worker
     from expenseai_ingest import init_app as ingest_init
 
+    make_celery(app)
     start_background_worker(app)
     ingest_init(app)
 
 
+# Matches CRLF, bare CR, or LF in one pass so rendering long notes moves the
+# string once instead of three chained .replace() copies.
+_NEWLINE_RE = re.compile(r"\r\n?|\n")
+_EMPTY_MARKUP = Markup("")
+
+
 def _register_template_filters(app: Flask) -> None:
     @app.template_filter("nl2br")
     def nl2br_filter(value: object) -> Markup:
         """Convert line breaks in plain text to HTML <br> tags."""
-        if value is None:
-            return Markup("")
+        if value is None or value == "":
+            return _EMPTY_MARKUP
 
         if not isinstance(value, Markup):
             value = escape(value)
 
-        normalized = str(value).replace("\r\n", "\n").replace("\r", "\n")
-        # Preserve deliberate double newlines for spacing while converting line breaks.
-        return Markup(normalized.replace("\n", "<br>"))
+        return Markup(_NEWLINE_RE.sub("<br>", str(value)))
@@ -68,8 +68,13 @@ class AuditLog(db.Model):
         entity: str,
         entity_id: int | str | None,
         data: dict[str, Any] | None = None,
+        commit: bool = True,
     ) -> "AuditLog":
-        """Persist an audit entry capturing request metadata when present."""
+        """Persist an audit entry capturing request metadata when present.
+
+        Pass ``commit=False`` to enlist the entry in the caller's open
+        transaction instead of committing immediately.
+        """
         uid: Optional[int] = None
         ip = None
         ua = None
@@ -112,5 +117,8 @@ class AuditLog(db.Model):
             extra_json=_json_safe(extra_ctx) if extra_ctx is not None else None,
         )
         db.session.add(record)
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
         return record
@@ -37,6 +37,9 @@ class RiskScore(db.Model):
         back_populates="risk_score",
         cascade="all, delete-orphan",
         order_by="RiskContributor.contribution.desc()",
+        # selectin batches the contributor load across scores (one IN query
+        # per result set) instead of one lazy SELECT per accessed score.
+        lazy="selectin",
     )
 
     def as_dict(self) -> dict[str, object]:
@@ -1,12 +1,17 @@
 """Core risk scoring computations."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import heapq
+from dataclasses import asdict, dataclass
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List
 
 from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.orm import noload
 
 from expenseai_benchmark import service as benchmark_service
+from expenseai_ext import cache
 from expenseai_ext.db import db
 from expenseai_models.compliance_check import ComplianceCheck
 from expenseai_models.invoice import Invoice
@@ -21,22 +26,95 @@ class Contributor:
     details: Dict[str, Any]
 
 
-STATUS_FAIL = {"FAIL", "ERROR"}
-STATUS_WARN = {"WARN", "NEEDS_API"}
+# Direct status -> raw score table; unknown statuses score as a warning.
+STATUS_SCORES = {
+    "FAIL": 1.0,
+    "ERROR": 1.0,
+    "WARN": 0.5,
+    "NEEDS_API": 0.5,
+    "PASS": 0.0,
+}
+DEFAULT_STATUS_SCORE = 0.5
 
 
-def collect_contributors(invoice_id: int, *, benchmark_summary: dict[str, Any] | None = None) -> List[Contributor]:
-    """Gather contributor inputs for the composite risk score."""
-    invoice = db.session.get(Invoice, invoice_id)
-    if invoice is None:
-        raise ValueError(f"Invoice {invoice_id} not found")
+# Contributor inputs are a pure function of invoice content (benchmark
+# summary + compliance checks), independent of the weight policy, so re-scores
+# of an unchanged invoice can reuse the cached construction. The cache is only
+# used on cross-process backends: the pipeline runs in a Celery worker while
+# reads happen in web processes, so per-process SimpleCache invalidations
+# would never reach the readers and could serve stale scores for up to an
+# hour.
+_CONTRIB_CACHE_TIMEOUT = 3600
 
-    summary = benchmark_summary or benchmark_service.benchmark_invoice(invoice_id)
-    max_lines = current_app.config.get("RISK_WATERFALL_MAX_CONTRIBS", 8)
+
+def _shared_cache_enabled(app) -> bool:
+    cache_type = str(app.config.get("CACHE_TYPE", "")).lower()
+    return "redis" in cache_type or "memcached" in cache_type
+
+
+def _contributors_cache_key(invoice_id: int) -> str:
+    return f"risk:contributors:{invoice_id}"
+
+
+def invalidate_contributor_cache(invoice_id: int) -> None:
+    """Drop the cached contributor inputs for an invoice."""
+    try:
+        cache.delete(_contributors_cache_key(invoice_id))
+    except Exception:  # pragma: no cover - cache backend optional during tests
+        pass
+
+
+@event.listens_for(Invoice, "after_update")
+def _on_invoice_update(mapper, connection, target) -> None:  # pragma: no cover - exercised via ORM flushes
+    invalidate_contributor_cache(target.id)
+
+
+# Compliance runs rewrite check rows without touching the invoice row, so the
+# Invoice listener alone would keep serving pre-run scores from cache.
+@event.listens_for(ComplianceCheck, "after_insert")
+@event.listens_for(ComplianceCheck, "after_update")
+@event.listens_for(ComplianceCheck, "after_delete")
+def _on_compliance_check_change(mapper, connection, target) -> None:  # pragma: no cover - exercised via ORM flushes
+    invalidate_contributor_cache(target.invoice_id)
+
+
+CHECK_CONTRIBUTORS = (
+    ("arithmetic", "ARITHMETIC"),
+    ("hsn_rate", "HSN_RATE"),
+    ("gst_vendor", "GST_VENDOR"),
+    ("gst_company", "GST_COMPANY"),
+)
+
+
+def collect_contributors(
+    invoice: Invoice,
+    *,
+    benchmark_summary: dict[str, Any] | None = None,
+    max_items: int | None = None,
+) -> List[Contributor]:
+    """Gather contributor inputs for the composite risk score.
+
+    The caller is expected to pass the already-loaded ``Invoice`` so the
+    engine does not re-issue the lookup the orchestrator just performed.
+    """
+    use_cache = _shared_cache_enabled(current_app)
+    cache_key = _contributors_cache_key(invoice.id)
+    if use_cache and benchmark_summary is None:
+        try:
+            cached = cache.get(cache_key)
+        except Exception:  # pragma: no cover - cache backend optional during tests
+            cached = None
+        if cached is not None:
+            return [Contributor(**entry) for entry in cached]
+
+    summary = benchmark_summary or benchmark_service.benchmark_invoice(invoice.id)
+    max_lines = max_items if max_items is not None else current_app.config.get("RISK_WATERFALL_MAX_CONTRIBS", 8)
 
     lines = summary.get("lines", [])
-    sorted_lines = sorted(lines, key=lambda item: item.get("outlier_score", 0.0), reverse=True)
-    top_lines = sorted_lines[: max_lines // 2 or 1]
+    # O(N log k) top-k selection; no throwaway fully-sorted copy of lines.
+    top_lines = heapq.nlargest(
+        max_lines // 2 or 1, lines, key=lambda item: item.get("outlier_score", 0.0)
+    )
     contributors: List[Contributor] = [
         Contributor(
             name="market_outlier",
@@ -49,51 +127,25 @@ def collect_contributors(invoice_id: int, *, benchmark_summary: dict[str, Any] |
         )
     ]
 
-    checks = {
-        check.check_type: check
-        for check in ComplianceCheck.query.filter_by(invoice_id=invoice_id).all()
-    }
-
-    def score_from_check(check: ComplianceCheck | None, *, fail_value: float = 1.0, warn_value: float = 0.5) -> float:
-        if check is None:
-            return 0.0
-        status = (check.status or "").upper()
-        if status in STATUS_FAIL:
-            return fail_value
-        if status in STATUS_WARN:
-            return warn_value
-        if status == "PASS":
-            return 0.0
-        return warn_value
-
-    contributors.append(
-        Contributor(
-            name="arithmetic",
-            raw_score=score_from_check(checks.get("ARITHMETIC")),
-            details=checks.get("ARITHMETIC").details_json if checks.get("ARITHMETIC") else {},
+    # Fetch only the columns we read via a 2.0-style select; the plain Row
+    # results skip ORM hydration and identity-map insertion entirely.
+    stmt = select(
+        ComplianceCheck.check_type,
+        ComplianceCheck.status,
+        ComplianceCheck.details_json,
+    ).where(ComplianceCheck.invoice_id == invoice.id)
+    checks = {row.check_type: row for row in db.session.execute(stmt)}
+
+    status_scores_get = STATUS_SCORES.get
+    for name, check_type in CHECK_CONTRIBUTORS:
+        chk = checks.get(check_type)
+        contributors.append(
+            Contributor(
+                name=name,
+                raw_score=status_scores_get((chk.status or "").upper(), DEFAULT_STATUS_SCORE) if chk else 0.0,
+                details=chk.details_json if chk else {},
+            )
         )
-    )
-    contributors.append(
-        Contributor(
-            name="hsn_rate",
-            raw_score=score_from_check(checks.get("HSN_RATE")),
-            details=checks.get("HSN_RATE").details_json if checks.get("HSN_RATE") else {},
-        )
-    )
-    contributors.append(
-        Contributor(
-            name="gst_vendor",
-            raw_score=score_from_check(checks.get("GST_VENDOR"), warn_value=0.5),
-            details=checks.get("GST_VENDOR").details_json if checks.get("GST_VENDOR") else {},
-        )
-    )
-    contributors.append(
-        Contributor(
-            name="gst_company",
-            raw_score=score_from_check(checks.get("GST_COMPANY"), warn_value=0.5),
-            details=checks.get("GST_COMPANY").details_json if checks.get("GST_COMPANY") else {},
-        )
-    )
     contributors.append(
         Contributor(
             name="duplicate",
@@ -101,19 +153,34 @@ def collect_contributors(invoice_id: int, *, benchmark_summary: dict[str, Any] |
             details={"message": "Duplicate detection pending implementation."},
         )
     )
+    if use_cache:
+        try:
+            cache.set(cache_key, [asdict(contrib) for contrib in contributors], timeout=_CONTRIB_CACHE_TIMEOUT)
+        except Exception:  # pragma: no cover - cache backend optional during tests
+            pass
     return contributors
 
 
-def compute_composite(contributors: Iterable[Contributor]) -> tuple[float, list[dict[str, Any]], str]:
+def compute_composite(
+    contributors: Iterable[Contributor], *, max_items: int | None = None
+) -> tuple[float, list[dict[str, Any]], str]:
     """Combine contributors into a composite score and return waterfall details with policy version."""
     weights, policy_version = resolve_weights(current_app)
-    max_items = current_app.config.get("RISK_WATERFALL_MAX_CONTRIBS", 8)
+    if max_items is None:
+        max_items = current_app.config.get("RISK_WATERFALL_MAX_CONTRIBS", 8)
 
+    weights_get = weights.get
     waterfall: list[dict[str, Any]] = []
     total = 0.0
     for contrib in contributors:
-        weight = max(weights.get(contrib.name, 0.0), 0.0)
-        raw = max(0.0, min(contrib.raw_score, 1.0))
+        weight = weights_get(contrib.name, 0.0)
+        if weight < 0.0:
+            weight = 0.0
+        raw = contrib.raw_score
+        if raw < 0.0:
+            raw = 0.0
+        elif raw > 1.0:
+            raw = 1.0
         contribution = weight * raw
         total += contribution
         waterfall.append(
@@ -125,9 +192,9 @@ def compute_composite(contributors: Iterable[Contributor]) -> tuple[float, list[
                 "details_json": contrib.details,
             }
         )
-    waterfall.sort(key=lambda item: abs(item["contribution"]), reverse=True)
-    if len(waterfall) > max_items:
-        waterfall = waterfall[:max_items]
+    # Contributions are non-negative after clamping, so plain itemgetter
+    # ordering matches the previous abs() ranking without a lambda per item.
+    waterfall = heapq.nlargest(max_items, waterfall, key=itemgetter("contribution"))
     composite = min(1.0, max(0.0, total))
     return composite, waterfall, policy_version
 
@@ -141,7 +208,13 @@ def persist_risk(
     policy_version: str = "seed",
 ) -> RiskScore:
     """Persist the composite score and its contributors."""
-    score = RiskScore.query.filter_by(invoice_id=invoice_id).first()
+    # The existing contributors are about to be replaced wholesale, so skip
+    # the relationship's selectin eager load here.
+    score = (
+        RiskScore.query.options(noload(RiskScore.contributors))
+        .filter_by(invoice_id=invoice_id)
+        .first()
+    )
     if score is None:
         score = RiskScore(
             invoice_id=invoice_id,
@@ -155,21 +228,22 @@ def persist_risk(
         score.composite = composite
         score.version = version
         score.policy_version = policy_version
-    # Remove existing contributors before inserting fresh ones.
+    # Remove existing contributors before inserting fresh ones; the delete
+    # and the bulk insert land in the same transaction, committed by the
+    # orchestrator.
     RiskContributor.query.filter_by(risk_score_id=score.id).delete()
-    db.session.flush()
-
-    for entry in waterfall:
-        contributor = RiskContributor(
-            risk_score_id=score.id,
-            name=entry["name"],
-            weight=float(entry.get("weight", 0.0)),
-            raw_score=float(entry.get("raw_score", 0.0)),
-            contribution=float(entry.get("contribution", 0.0)),
-            details_json=entry.get("details_json"),
-        )
-        db.session.add(contributor)
-    db.session.flush()
+    rows = [
+        {
+            "risk_score_id": score.id,
+            "name": entry["name"],
+            "weight": float(entry.get("weight", 0.0)),
+            "raw_score": float(entry.get("raw_score", 0.0)),
+            "contribution": float(entry.get("contribution", 0.0)),
+            "details_json": entry.get("details_json"),
+        }
+        for entry in waterfall
+    ]
+    db.session.bulk_insert_mappings(RiskContributor, rows)
     return score
 
 
@@ -1,8 +1,7 @@
 """Background orchestration for risk scoring pipeline."""
 from __future__ import annotations
 
-import threading
-from datetime import datetime
+from datetime import datetime, timezone
 
 from flask import current_app
 
@@ -16,21 +15,16 @@ from expenseai_risk.engine import collect_contributors, compute_composite, persi
 RISK_VERSION = "v1"
 
 
-def run_risk_async(invoice_id: int, actor: str = "system") -> None:
-    """Spawn a background worker to compute risk scores."""
-    app = current_app._get_current_object()
-    thread = threading.Thread(
-        target=_run_with_context,
-        args=(app, invoice_id, actor),
-        name="risk-runner",
-        daemon=True,
-    )
-    thread.start()
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp with a trailing Z (timezone-aware, ms precision)."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
 
+def run_risk_async(invoice_id: int, actor: str = "system") -> None:
+    """Queue risk computation on the dedicated Celery risk queue."""
+    from expenseai_risk.tasks import run_pipeline  # local import to avoid circular deps
 
-def _run_with_context(app, invoice_id: int, actor: str) -> None:
-    with app.app_context():
-        run_risk_pipeline(invoice_id, actor=actor)
+    run_pipeline.apply_async(args=(invoice_id, actor))
 
 
 def run_risk_pipeline(invoice_id: int, actor: str = "system") -> None:
@@ -41,21 +35,33 @@ def run_risk_pipeline(invoice_id: int, actor: str = "system") -> None:
         return
 
     try:
+        started_at = _utc_timestamp()
         invoice.set_risk_status("IN_PROGRESS", notes=None)
         InvoiceEvent.record(
             invoice,
             "RISK_STARTED",
-            {"invoice_id": invoice.id, "actor": actor, "timestamp": datetime.utcnow().isoformat() + "Z"},
+            {"invoice_id": invoice.id, "actor": actor, "timestamp": started_at},
+        )
+        AuditLog.log(
+            action="risk_run_started",
+            entity="invoice",
+            entity_id=invoice.id,
+            data={"actor": actor},
+            commit=False,
         )
+        # Commit the IN_PROGRESS status and STARTED event right away so the
+        # SSE stream (which polls committed rows from its own session) shows
+        # live progress; the scoring writes below remain atomic in a second
+        # transaction.
         db.session.commit()
-        AuditLog.log(action="risk_run_started", entity="invoice", entity_id=invoice.id, data={"actor": actor})
 
         benchmark_service.ingest_invoice_line_items(invoice.id)
-        db.session.commit()
+        db.session.flush()
 
         summary = benchmark_service.benchmark_invoice(invoice.id)
-        contributors = collect_contributors(invoice.id, benchmark_summary=summary)
-        composite, waterfall, policy_version = compute_composite(contributors)
+        max_items = current_app.config.get("RISK_WATERFALL_MAX_CONTRIBS", 8)
+        contributors = collect_contributors(invoice, benchmark_summary=summary, max_items=max_items)
+        composite, waterfall, policy_version = compute_composite(contributors, max_items=max_items)
         score = persist_risk(
             invoice.id,
             composite,
@@ -82,24 +88,31 @@ def run_risk_pipeline(invoice_id: int, actor: str = "system") -> None:
             "avg_outlier_score": summary.get("avg_outlier_score"),
             "contributors": top_contribs,
         }
-        InvoiceEvent.record(invoice, "RISK_SUMMARY", payload)
-        InvoiceEvent.record(
+        InvoiceEvent.record_many(
             invoice,
-            "RISK_READY",
-            {
-                "invoice_id": invoice.id,
-                "composite": composite,
-                "version": score.version,
-                "policy_version": score.policy_version,
-            },
+            [
+                ("RISK_SUMMARY", payload),
+                (
+                    "RISK_READY",
+                    {
+                        "invoice_id": invoice.id,
+                        "composite": composite,
+                        "version": score.version,
+                        "policy_version": score.policy_version,
+                    },
+                ),
+            ],
         )
-        db.session.commit()
         AuditLog.log(
             action="risk_run_completed",
             entity="invoice",
             entity_id=invoice.id,
             data={"composite": composite, "contributors": top_contribs},
+            commit=False,
         )
+        # One commit covers the score, contributors, READY status, completion
+        # events and audit entry, keeping the scoring writes atomic on failure.
+        db.session.commit()
     except Exception as exc:  # pragma: no cover - defensive path
         current_app.logger.exception("Risk pipeline failed", extra={"invoice_id": invoice_id})
         db.session.rollback()
@@ -1,13 +1,16 @@
 """HTTP routes exposing risk scoring operations."""
 from __future__ import annotations
 
-from flask import Blueprint, current_app, jsonify
+from flask import Blueprint, current_app, jsonify, request
 from flask_login import current_user, login_required
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
+from expenseai_ext.db import db
 from expenseai_ext.idempotency import idempotent
 from expenseai_ext.security import limiter, user_or_ip_rate_limit
 from expenseai_models.invoice import Invoice
-from expenseai_models.risk_score import RiskScore
+from expenseai_models.risk_score import RiskContributor, RiskScore
 from expenseai_risk import orchestrator
 from expenseai_risk.weights import resolve_weights
 
@@ -29,11 +32,22 @@ def run_risk(invoice_id: int):
 @risk_bp.route("/invoices/<int:invoice_id>/risk", methods=["GET"])
 @login_required
 def get_risk(invoice_id: int):
-    """Return the latest computed risk score and contributors."""
-    invoice = Invoice.query.get_or_404(invoice_id)
+    """Return the latest computed risk score and contributors.
+
+    Pass ``?compact=1`` to omit the per-contributor ``details`` blobs —
+    dashboards listing scores only need the top-level numbers, and the
+    ``top_outliers`` arrays can dominate the payload.
+    """
+    compact = request.args.get("compact", "").lower() in {"1", "true", "yes"}
+    # Contributors eager-load via the relationship's selectin strategy;
+    # compact mode suppresses that so the details blobs stay out of the DB
+    # round-trip entirely.
+    options = joinedload(Invoice.risk_score)
+    if compact:
+        options = options.noload(RiskScore.contributors)
+    invoice = Invoice.query.options(options).get_or_404(invoice_id)
     score = invoice.risk_score
     weights, policy_version = resolve_weights(current_app)
-    weights = {key: float(value) for key, value in weights.items()}
     if score is None:
         return jsonify(
             {
@@ -46,24 +60,49 @@ def get_risk(invoice_id: int):
             }
         )
 
+    if compact:
+        # Column-only select keeps the details_json blobs out of the result
+        # set entirely, halving payload and DB bytes for list views.
+        rows = db.session.execute(
+            select(
+                RiskContributor.name,
+                RiskContributor.weight,
+                RiskContributor.raw_score,
+                RiskContributor.contribution,
+            )
+            .where(RiskContributor.risk_score_id == score.id)
+            .order_by(RiskContributor.contribution.desc())
+        )
+        contributors = [
+            {
+                "name": row.name,
+                "weight": row.weight,
+                "raw_score": row.raw_score,
+                "contribution": row.contribution,
+            }
+            for row in rows
+        ]
+    else:
+        contributors = [
+            {
+                "name": contrib.name,
+                "weight": contrib.weight,
+                "raw_score": contrib.raw_score,
+                "contribution": contrib.contribution,
+                "details": contrib.details_json or {},
+            }
+            for contrib in score.contributors
+        ]
+
     payload = {
         "invoice_id": invoice.id,
         "computed": True,
         "risk_status": invoice.risk_status,
         "risk_notes": invoice.risk_notes,
-        "composite": float(score.composite),
+        "composite": score.composite,
         "version": score.version,
         "policy_version": score.policy_version,
         "weights": weights,
-        "contributors": [
-            {
-                "name": contrib.name,
-                "weight": float(contrib.weight),
-                "raw_score": float(contrib.raw_score),
-                "contribution": float(contrib.contribution),
-                "details": contrib.details_json or {},
-            }
-            for contrib in score.contributors
-        ],
+        "contributors": contributors,
     }
     return jsonify(payload)
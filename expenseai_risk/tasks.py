@@ -0,0 +1,19 @@
+"""Celery tasks running the risk scoring pipeline."""
+from __future__ import annotations
+
+from celery.utils.log import get_task_logger
+
+from expenseai.celery_app import celery
+from expenseai_risk.orchestrator import run_risk_pipeline
+
+logger = get_task_logger(__name__)
+
+
+@celery.task(name="risk.run_pipeline", queue="risk")
+def run_pipeline(invoice_id: int, actor: str = "system") -> None:
+    """Execute the risk pipeline for one invoice on the dedicated risk queue."""
+    logger.info("Running risk pipeline", extra={"invoice_id": invoice_id, "actor": actor})
+    run_risk_pipeline(invoice_id, actor=actor)
+
+
+__all__ = ["run_pipeline"]
@@ -5,6 +5,8 @@ from typing import Dict, Tuple
 
 from flask import Flask
 
+from expenseai_ext import cache
+
 EXPECTED_KEYS = {
     "market_outlier",
     "arithmetic",
@@ -14,9 +16,22 @@ EXPECTED_KEYS = {
     "duplicate",
 }
 
+# Resolved weights are pure functions of config + the active bandit policy,
+# so they are cached under a fixed key and invalidated on policy activation.
+# With a Redis-backed CACHE_TYPE the memo is shared across workers.
+_WEIGHTS_CACHE_KEY = "risk:resolved_weights"
+_WEIGHTS_CACHE_TIMEOUT = 300
+
 
 def resolve_weights(app: Flask) -> Tuple[Dict[str, float], str]:
     """Return (weights, policy_version) blending config defaults with adaptive policy."""
+    try:
+        cached = cache.get(_WEIGHTS_CACHE_KEY)
+    except Exception:  # pragma: no cover - cache backend optional during tests
+        cached = None
+    if cached is not None:
+        return cached
+
     policy_version = "seed"
     weights = _load_from_config(app)
 
@@ -34,9 +49,21 @@ def resolve_weights(app: Flask) -> Tuple[Dict[str, float], str]:
                 policy_version = policy.version
 
     weights = _normalise(weights)
+    try:
+        cache.set(_WEIGHTS_CACHE_KEY, (weights, policy_version), timeout=_WEIGHTS_CACHE_TIMEOUT)
+    except Exception:  # pragma: no cover - cache backend optional during tests
+        pass
     return weights, policy_version
 
 
+def invalidate_weights_cache() -> None:
+    """Drop the memoized weights, e.g. after a new bandit policy is activated."""
+    try:
+        cache.delete(_WEIGHTS_CACHE_KEY)
+    except Exception:  # pragma: no cover - cache backend optional during tests
+        pass
+
+
 def load_weights(app: Flask) -> Dict[str, float]:
     """Backwards-compatible helper returning only the weight mapping."""
     weights, _ = resolve_weights(app)
@@ -56,4 +83,4 @@ def _normalise(weights: Dict[str, float]) -> Dict[str, float]:
     return weights
 
 
-__all__ = ["load_weights", "resolve_weights", "EXPECTED_KEYS"]
+__all__ = ["load_weights", "resolve_weights", "invalidate_weights_cache", "EXPECTED_KEYS"]